@@ -1,4 +1,5 @@
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List,Tuple, Dict, Sequence,TYPE_CHECKING
 import json
 
@@ -17,6 +18,7 @@ from slicer.util import VTKObservationMixin
 from slicer.parameterNodeWrapper import parameterNodeWrapper
 from slicer import (
     vtkMRMLScriptedModuleNode,
+    vtkMRMLTransformNode,
 )
 
 from OpenLIFULib import (
@@ -28,6 +30,7 @@ from OpenLIFULib import (
     SlicerOpenLIFUSession,
     get_target_candidates,
     assign_openlifu_metadata_to_volume_node,
+    BusyCursor,
 )
 from OpenLIFULib.util import (
     display_errors,
@@ -42,6 +45,42 @@ if TYPE_CHECKING:
     import openlifu # This import is deferred at runtime using openlifu_lz, but it is done here for IDE and static analysis purposes
     import openlifu.db
 
+# Sentinel for dictionary lookups where None could be a legitimate value
+_MISSING = object()
+
+# File extensions that are known to be loadable as volumes, i.e. those of the volume file type filter used in this module.
+# These let us recognize volume files without having to query Slicer's IO manager.
+_VOLUME_FILE_EXTENSIONS = (
+    '.hdr', '.nhdr', '.nrrd', '.mhd', '.mha', '.mnc', '.nii', '.nii.gz', '.mgh', '.mgz', '.mgh.gz', '.img', '.img.gz', '.pic',
+)
+
+# The vtkMRMLNode-valued attributes of SlicerOpenLIFUTransducer, i.e. the scene nodes that a transducer depends on
+_TRANSDUCER_AFFILIATED_NODE_ATTRIBUTE_NAMES = frozenset(('transform_node', 'model_node'))
+
+def _is_volume_file(filepath:str) -> bool:
+    """Whether the given file exists and can be loaded as a volume. Common volume extensions are recognized directly,
+    and only for anything else do we ask Slicer's IO manager."""
+    if not Path(filepath).exists():
+        return False
+    return str(filepath).lower().endswith(_VOLUME_FILE_EXTENSIONS) or slicer.app.coreIOManager().fileType(filepath) == 'VolumeFile'
+
+def _map_file_reads(function, items:Sequence) -> List:
+    """Apply a function that reads files to each of the given items, returning the results in order.
+
+    The reads are independent and mostly spent waiting on the disk, so they are spread over a few threads.
+    The function must not touch Qt or the MRML scene, and so in particular it must not go through openlifu
+    Database methods, since those log through a Slicer log handler.
+    """
+    if len(items) < 4: # Not worth starting up threads for
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+        return list(executor.map(function, items))
+
+def _read_name_from_json_file(filepath:Path) -> Optional[str]:
+    """Read just the "name" field of an openlifu object's json file, or None if there is no name"""
+    with open(filepath) as f:
+        return json.load(f).get("name")
+
 #
 # OpenLIFUData
 #
@@ -220,14 +259,18 @@ class AddNewVolumeDialog(qt.QDialog):
     def updateVolumeDetails(self):
         current_filepath = Path(self.volumeFilePath.currentPath)
         if current_filepath.is_file():
-            while current_filepath.suffix:
-                current_filepath = current_filepath.with_suffix('')
-            volume_name = current_filepath.stem
+            volume_name = current_filepath.name.partition('.')[0] # strip all suffixes, e.g. for .nii.gz
             if not len(self.volumeName.text):
                 self.volumeName.setText(volume_name)
             if not len(self.volumeID.text):
                 self.volumeID.setText(volume_name)
 
+    def resetInputs(self):
+        """Clear the inputs, so that the dialog can be shown again for a new volume"""
+        self.volumeFilePath.currentPath = ""
+        self.volumeName.setText("")
+        self.volumeID.setText("")
+
     def validateInputs(self):
 
         volume_name = self.volumeName.text
@@ -236,7 +279,7 @@ class AddNewVolumeDialog(qt.QDialog):
 
         if not len(volume_name) or not len(volume_id) or not len(volume_filepath):
             slicer.util.errorDisplay("Required fields are missing", parent = self)
-        elif not slicer.app.coreIOManager().fileType(volume_filepath) == 'VolumeFile':
+        elif not _is_volume_file(volume_filepath):
             slicer.util.errorDisplay("Invalid volume filetype specified", parent = self)
         else:
             self.accept()
@@ -311,9 +354,7 @@ class AddNewPhotoscanDialog(qt.QDialog):
     def updatePhotoscanDetails(self):
         current_filepath = Path(self.photoscanModelFilePath.currentPath)
         if current_filepath.is_file():
-            while current_filepath.suffix:
-                current_filepath = current_filepath.with_suffix('')
-            photoscan_name = current_filepath.stem
+            photoscan_name = current_filepath.name.partition('.')[0] # strip all suffixes, e.g. for .nii.gz
             if not len(self.photoscanName.text):
                 self.photoscanName.setText(photoscan_name)
             if not len(self.photoscanID.text):
@@ -381,6 +422,11 @@ class AddNewSubjectDialog(qt.QDialog):
         self.buttonBox.rejected.connect(self.reject)
         self.buttonBox.accepted.connect(self.accept)
 
+    def resetInputs(self):
+        """Clear the inputs, so that the dialog can be shown again for a new subject"""
+        self.subjectName.setText("")
+        self.subjectID.setText("")
+
     def customexec_(self):
 
         returncode = self.exec_()
@@ -443,6 +489,11 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self.logic = None
         self._parameterNode = None
         self._parameterNodeGuiTag = None
+        self.qsettings = qt.QSettings() # Application settings; one instance is kept rather than constructing it on each access
+
+        # The add subject and add volume dialogs are built on first use and then reused
+        self.addNewSubjectDialog : Optional[AddNewSubjectDialog] = None
+        self.addNewVolumeDialog : Optional[AddNewVolumeDialog] = None
 
     def setup(self) -> None:
         """Called when the user opens the module the first time and the widget is initialized."""
@@ -526,8 +577,37 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self.loadedObjectsItemModel = qt.QStandardItemModel()
         self.loadedObjectsItemModel.setHorizontalHeaderLabels(['Name', 'Type', 'ID'])
         self.ui.loadedObjectsView.setModel(self.loadedObjectsItemModel)
+        self.loadedObjectsRows : List[Tuple[str,str,str]] = [] # The (name, type, id) rows currently shown in the loaded objects view
         self.ui.loadedObjectsView.setColumnWidth(0, 150)
         self.ui.loadedObjectsView.setColumnWidth(1, 150)
+
+        # Parameter node modifications and scene node additions/removals tend to arrive in bursts (e.g. while a session is
+        # being loaded), so refreshes of the loaded objects view that are triggered by them are debounced through this
+        # single-shot timer.
+        self.loadedObjectsViewRefreshTimer = qt.QTimer()
+        self.loadedObjectsViewRefreshTimer.setSingleShot(True)
+        self.loadedObjectsViewRefreshTimer.setInterval(50)
+        self.loadedObjectsViewRefreshTimer.timeout.connect(self.updateLoadedObjectsView)
+
+        # The session status is refreshed on parameter node modifications, which come in bursts while a session is being loaded
+        # or saved. Reading the session and its protocol and transducer back out of the parameter node is not cheap, so these
+        # refreshes are coalesced into one at the end of the current event loop iteration.
+        self.sessionStatusRefreshTimer = qt.QTimer()
+        self.sessionStatusRefreshTimer.setSingleShot(True)
+        self.sessionStatusRefreshTimer.setInterval(0)
+        self.sessionStatusRefreshTimer.timeout.connect(self.updateSessionStatus)
+
+        # Whether a refresh of the loaded objects view was skipped because the module was not being shown;
+        # the refresh is then done upon entering the module.
+        self.loadedObjectsViewRefreshPending = False
+
+        # The volume and fiducial nodes to list in the loaded objects view are tracked by ID as they are added to and
+        # removed from the scene, so that refreshing the view does not require scanning the whole scene.
+        # (Dicts are used as insertion-ordered sets.)
+        self.volumeNodeIds : Dict[str,None] = {}
+        self.fiducialNodeIds : Dict[str,None] = {}
+        self.resetTrackedNodeIds()
+
         self.ui.loadProtocolButton.clicked.connect(self.onLoadProtocolPressed)
         self.ui.loadVolumeButton.clicked.connect(self.onLoadVolumePressed)
         self.ui.loadFiducialsButton.clicked.connect(self.onLoadFiducialsPressed)
@@ -582,17 +662,24 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         self.update_newSubjectButton_enabled()
 
     def updateSubjectSessionSelector(self):
-        # Clear any items that are already there
-        self.subjectSessionItemModel.removeRows(0,self.subjectSessionItemModel.rowCount())
+        with BusyCursor():
+            subject_info = list(self.logic.load_database(self.ui.databaseDirectoryLineEdit.currentPath))
+
+        subject_ids, subject_names = zip(*subject_info) if subject_info else ((), ())
+
+        self.ui.subjectSessionView.setUpdatesEnabled(False)
+        try:
+            # Clear any items that are already there. This also clears the header, so it's restored afterwards.
+            self.subjectSessionItemModel.clear()
 
-        subject_info = self.logic.load_database(self.ui.databaseDirectoryLineEdit.currentPath)
+            # Populate the model a column at a time rather than a row at a time
+            self.subjectSessionItemModel.appendColumn([create_noneditable_QStandardItem(name) for name in subject_names])
+            self.subjectSessionItemModel.appendColumn([create_noneditable_QStandardItem(id) for id in subject_ids])
 
-        for subject_id, subject_name in subject_info:
-            subject_row = list(map(
-                create_noneditable_QStandardItem,
-                [subject_name,subject_id]
-            ))
-            self.subjectSessionItemModel.appendRow(subject_row)
+            self.subjectSessionItemModel.setHorizontalHeaderLabels(['Name', 'ID'])
+            self.ui.subjectSessionView.setColumnWidth(0, 200) # make the Name column wider
+        finally:
+            self.ui.subjectSessionView.setUpdatesEnabled(True)
 
     def itemIsSession(self, index : qt.QModelIndex) -> bool:
         """Whether an item from the subject/session tree view is a session.
@@ -667,7 +754,10 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
     @display_errors
     def onAddNewSubjectClicked(self, checked:bool) -> None:
 
-        subjectdlg = AddNewSubjectDialog()
+        if self.addNewSubjectDialog is None:
+            self.addNewSubjectDialog = AddNewSubjectDialog()
+        subjectdlg = self.addNewSubjectDialog
+        subjectdlg.resetInputs()
         returncode, subject_name, subject_id = subjectdlg.customexec_()
 
         if returncode:
@@ -691,7 +781,10 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 
     @display_errors
     def onAddVolumeToSubjectClicked(self, checked:bool) -> None:
-        volumedlg = AddNewVolumeDialog()
+        if self.addNewVolumeDialog is None:
+            self.addNewVolumeDialog = AddNewVolumeDialog()
+        volumedlg = self.addNewVolumeDialog
+        volumedlg.resetInputs()
         returncode, volume_filepath, volume_name, volume_id = volumedlg.customexec_()
         if not returncode:
             return False
@@ -745,17 +838,17 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         subject_item = self.subjectSessionItemModel.itemFromIndex(index.siblingAtColumn(0))
 
         if subject_item.rowCount() == 0: # If we have not already expanded this subject
-            for session_id, session_name in self.logic.get_session_info(subject_id):
-                session_row = list(map(
-                    create_noneditable_QStandardItem,
-                    [session_name, session_id]
-                ))
-                subject_item.appendRow(session_row)
+            session_info = self.logic.get_session_info(subject_id)
+            if session_info:
+                session_ids, session_names = zip(*session_info)
+                self.ui.subjectSessionView.setUpdatesEnabled(False)
+                try:
+                    subject_item.appendColumn([create_noneditable_QStandardItem(name) for name in session_names])
+                    subject_item.appendColumn([create_noneditable_QStandardItem(id) for id in session_ids])
+                finally:
+                    self.ui.subjectSessionView.setUpdatesEnabled(True)
         elif session_name and session_id:
-            session_row = list(map(
-                    create_noneditable_QStandardItem,
-                    [session_name, session_id]
-                ))
+            session_row = [create_noneditable_QStandardItem(text) for text in [session_name, session_id]]
             subject_item.appendRow(session_row)
         self.ui.subjectSessionView.expand(index)
 
@@ -769,7 +862,7 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 
     @display_errors
     def onLoadProtocolPressed(self, checked:bool) -> None:
-        qsettings = qt.QSettings()
+        qsettings = self.qsettings
 
         filepath: str = qt.QFileDialog.getOpenFileName(
             slicer.util.mainWindow(), # parent
@@ -782,7 +875,7 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 
     @display_errors
     def onLoadTransducerPressed(self, checked:bool) -> None:
-        qsettings = qt.QSettings()
+        qsettings = self.qsettings
 
         filepath: str = qt.QFileDialog.getOpenFileName(
             slicer.util.mainWindow(), # parent
@@ -795,7 +888,7 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 
     def onLoadVolumePressed(self) -> None:
         """ Call slicer dialog to load volumes into the scene"""
-        qsettings = qt.QSettings()
+        qsettings = self.qsettings
 
         # Allowable volume filetypes includes *.json
         volume_extensions = ("Volume" + " (*.json *.hdr *.nhdr *.nrrd *.mhd *.mha *.mnc *.nii *.nii.gz *.mgh *.mgz *.mgh.gz *.img *.img.gz *.pic);;" +
@@ -811,7 +904,7 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 
         if filepath:
             self.logic.load_volume_from_file(filepath)
-            self.updateLoadedObjectsView() # Call function here to update view based on node attributes
+            self.loadedObjectsViewRefreshTimer.start() # Refresh once the openlifu metadata is on the node
 
 
     def onLoadFiducialsPressed(self) -> None:
@@ -824,73 +917,71 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         return ioManager.openDialog("MarkupsFile", slicer.qSlicerFileDialog.Read)
 
     def updateLoadedObjectsView(self):
-        self.loadedObjectsItemModel.removeRows(0,self.loadedObjectsItemModel.rowCount())
+        # Nobody is looking at the view while the user is in another module, so defer the refresh until they come back
+        if not self.parent.isEntered:
+            self.loadedObjectsViewRefreshPending = True
+            return
+        self.loadedObjectsViewRefreshPending = False
+
+        # Gather the (name, type, id) rows to display first, and then fill the model in one go
+        rows : List[Tuple[str,str,str]] = []
         parameter_node = self._parameterNode
-        if parameter_node is None:
+        if parameter_node is not None:
+            loaded_session = parameter_node.loaded_session
+            if loaded_session is not None:
+                session_openlifu : "openlifu.db.Session" = loaded_session.session.session
+                rows.append((session_openlifu.name, "Session", session_openlifu.id))
+            for protocol in parameter_node.loaded_protocols.values():
+                rows.append((protocol.protocol.name, "Protocol", protocol.protocol.id))
+            for transducer_slicer in parameter_node.loaded_transducers.values():
+                transducer_slicer : SlicerOpenLIFUTransducer
+                transducer_openlifu : "openlifu.Transducer" = transducer_slicer.transducer.transducer
+                rows.append((transducer_openlifu.name, "Transducer", transducer_openlifu.id))
+            for volume_node in map(slicer.mrmlScene.GetNodeByID, self.volumeNodeIds):
+                if volume_node is None or volume_node.GetAttribute('isOpenLIFUSolution') is not None:
+                    continue
+                if volume_node.GetAttribute('OpenLIFUData.volume_id'):
+                    rows.append((volume_node.GetName(), "Volume", volume_node.GetAttribute('OpenLIFUData.volume_id')))
+                else:
+                    rows.append((volume_node.GetName(), "Volume", volume_node.GetID()))
+            for fiducial_node in map(slicer.mrmlScene.GetNodeByID, self.fiducialNodeIds):
+                if fiducial_node is None:
+                    continue
+                points_type = "Point" if fiducial_node.GetMaximumNumberOfControlPoints() == 1 else "Points"
+                rows.append((fiducial_node.GetName(), points_type, fiducial_node.GetID()))
+            loaded_solution = parameter_node.loaded_solution
+            if loaded_solution is not None:
+                solution_openlifu = loaded_solution.solution.solution
+                rows.append((solution_openlifu.name, "Solution", solution_openlifu.id))
+            loaded_run = parameter_node.loaded_run
+            if loaded_run is not None:
+                run_openlifu = loaded_run.run
+                rows.append((run_openlifu.name, "Run", run_openlifu.id))
+
+        # Parameter node modifications that do not concern the loaded objects (e.g. a change of database directory)
+        # leave the rows as they are, in which case there is nothing to do
+        if rows == self.loadedObjectsRows:
             return
-        if parameter_node.loaded_session is not None:
-            session : SlicerOpenLIFUSession = parameter_node.loaded_session
-            session_openlifu : "openlifu.db.Session" = session.session.session
-            row = list(map(
-                create_noneditable_QStandardItem,
-                [session_openlifu.name, "Session", session_openlifu.id]
-            ))
-            self.loadedObjectsItemModel.appendRow(row)
-        for protocol in parameter_node.loaded_protocols.values():
-            row = list(map(
-                create_noneditable_QStandardItem,
-                [protocol.protocol.name,  "Protocol", protocol.protocol.id]
-            ))
-            self.loadedObjectsItemModel.appendRow(row)
-        for transducer_slicer in parameter_node.loaded_transducers.values():
-            transducer_slicer : SlicerOpenLIFUTransducer
-            transducer_openlifu : "openlifu.Transducer" = transducer_slicer.transducer.transducer
-            row = list(map(
-                create_noneditable_QStandardItem,
-                [transducer_openlifu.name, "Transducer", transducer_openlifu.id]
-            ))
-            self.loadedObjectsItemModel.appendRow(row)
-        for volume_node in slicer.util.getNodesByClass('vtkMRMLScalarVolumeNode'):
-            if volume_node.GetAttribute('isOpenLIFUSolution') is not None:
-                continue
-            if volume_node.GetAttribute('OpenLIFUData.volume_id'):
-                row = list(map(
-                    create_noneditable_QStandardItem,
-                    [volume_node.GetName(), "Volume", volume_node.GetAttribute('OpenLIFUData.volume_id')]
-                ))
-            else:
-                row = list(map(
-                    create_noneditable_QStandardItem,
-                    [volume_node.GetName(), "Volume", volume_node.GetID()]
-                ))
-
-            self.loadedObjectsItemModel.appendRow(row)
-        for fiducial_node in slicer.util.getNodesByClass('vtkMRMLMarkupsFiducialNode'):
-            points_type = "Point" if fiducial_node.GetMaximumNumberOfControlPoints() == 1 else "Points"
-            row = list(map(
-                create_noneditable_QStandardItem,
-                [fiducial_node.GetName(), points_type, fiducial_node.GetID()]
-            ))
-            self.loadedObjectsItemModel.appendRow(row)
-        if parameter_node.loaded_solution is not None:
-            solution_openlifu = parameter_node.loaded_solution.solution.solution
-            row = list(map(
-                create_noneditable_QStandardItem,
-                [solution_openlifu.name, "Solution", solution_openlifu.id]
-            ))
-            self.loadedObjectsItemModel.appendRow(row)
-        
-        if parameter_node.loaded_run is not None:
-            run_openlifu = parameter_node.loaded_run.run
-            row = list(map(
-                create_noneditable_QStandardItem,
-                [run_openlifu.name, "Run", run_openlifu.id]
-            ))
-            self.loadedObjectsItemModel.appendRow(row)
 
+        # Suspend repainting of the view while the model is updated, so that it gets laid out once at the end.
+        # The model is resized all at once, and then only the rows that differ from what is already shown get new items;
+        # usually a refresh only adds or removes an object or two.
+        self.ui.loadedObjectsView.setUpdatesEnabled(False)
+        try:
+            self.loadedObjectsItemModel.setRowCount(len(rows))
+            for row_index, row in enumerate(rows):
+                if row_index < len(self.loadedObjectsRows) and self.loadedObjectsRows[row_index] == row:
+                    continue
+                for column_index, text in enumerate(row):
+                    self.loadedObjectsItemModel.setItem(row_index, column_index, create_noneditable_QStandardItem(text))
+            self.loadedObjectsRows = rows
+        finally:
+            self.ui.loadedObjectsView.setUpdatesEnabled(True)
 
     def updateSessionStatus(self):
         """Update the active session status view and related buttons"""
+        if self._parameterNode is None: # e.g. a deferred refresh arriving while the scene is being closed
+            return
         loaded_session = self._parameterNode.loaded_session
         if loaded_session is None:
             for label in self.session_status_field_widgets:
@@ -902,11 +993,10 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
                 button.setToolTip("There is no active session")
         else:
             session_openlifu : "openlifu.db.Session" = loaded_session.session.session
-            subject_openlifu = self.logic.get_subject(session_openlifu.subject_id)
             protocol_openlifu : "openlifu.Protocol" = loaded_session.get_protocol().protocol
             transducer_openlifu : "openlifu.Transducer" = loaded_session.get_transducer().transducer.transducer
             self.ui.sessionStatusSubjectNameIdValueLabel.setText(
-                f"{subject_openlifu.name} (ID: {session_openlifu.subject_id})"
+                f"{self.logic.get_subject_name(session_openlifu.subject_id)} (ID: {session_openlifu.subject_id})"
             )
             self.ui.sessionStatusSessionNameIdValueLabel.setText(
                 f"{session_openlifu.name} (ID: {session_openlifu.id})"
@@ -934,17 +1024,22 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             self.ui.saveSessionButton.setToolTip("Save the current session to the database, including session-specific transducer and target configurations")
 
     def onParameterNodeModified(self, caller, event) -> None:
-        self.updateLoadedObjectsView()
-        self.updateSessionStatus()
+        # restarting the timers coalesces bursts into a single refresh
+        self.loadedObjectsViewRefreshTimer.start()
+        self.sessionStatusRefreshTimer.start()
 
     def cleanup(self) -> None:
         """Called when the application closes and the module widget is destroyed."""
+        self.loadedObjectsViewRefreshTimer.stop()
+        self.sessionStatusRefreshTimer.stop()
         self.removeObservers()
 
     def enter(self) -> None:
         """Called each time the user opens this module."""
         # Make sure parameter node exists and observed
         self.initializeParameterNode()
+        if self.loadedObjectsViewRefreshPending:
+            self.updateLoadedObjectsView()
 
     def exit(self) -> None:
         """Called each time the user opens a different module."""
@@ -957,9 +1052,12 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         """Called just before the scene is closed."""
         # Parameter node will be reset, do not use it anymore
         self.setParameterNode(None)
+        self.logic.on_scene_start_close()
 
     def onSceneEndClose(self, caller, event) -> None:
         """Called just after the scene is closed."""
+        self.resetTrackedNodeIds()
+        self.loadedObjectsViewRefreshTimer.start()
         # If this module is shown while the scene is closed then recreate a new parameter node immediately
         if self.parent.isEntered:
             self.initializeParameterNode()
@@ -967,6 +1065,11 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
     @vtk.calldata_type(vtk.VTK_OBJECT)
     def onNodeAboutToBeRemoved(self, caller, event, node : slicer.vtkMRMLNode) -> None:
 
+        # When the whole scene is being closed, the parameter node with the loaded objects goes away too,
+        # so there is nothing to unload one node at a time.
+        if slicer.mrmlScene.IsClosing():
+            return
+
         # If any SlicerOpenLIFUTransducer objects relied on this transform node, then we need to remove them
         # as they are now invalid.
         if node.IsA('vtkMRMLTransformNode'):
@@ -978,15 +1081,26 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
     def onNodeRemoved(self, caller, event, node : slicer.vtkMRMLNode) -> None:
 
         # If the volume of the active session was removed, the session becomes invalid.
-        if node.IsA('vtkMRMLVolumeNode'):
+        if node.IsA('vtkMRMLVolumeNode') and not slicer.mrmlScene.IsClosing():
             self.logic.validate_session()
             self.logic.validate_solution()
 
-        self.updateLoadedObjectsView()
+        self.volumeNodeIds.pop(node.GetID(), None)
+        self.fiducialNodeIds.pop(node.GetID(), None)
+        self.loadedObjectsViewRefreshTimer.start()
 
     @vtk.calldata_type(vtk.VTK_OBJECT)
     def onNodeAdded(self, caller, event, node : slicer.vtkMRMLNode) -> None:
-        self.updateLoadedObjectsView()
+        if node.IsA('vtkMRMLScalarVolumeNode'):
+            self.volumeNodeIds[node.GetID()] = None
+        elif node.IsA('vtkMRMLMarkupsFiducialNode'):
+            self.fiducialNodeIds[node.GetID()] = None
+        self.loadedObjectsViewRefreshTimer.start()
+
+    def resetTrackedNodeIds(self) -> None:
+        """Rebuild the tracked volume and fiducial node IDs from the nodes currently in the scene."""
+        self.volumeNodeIds = dict.fromkeys(node.GetID() for node in slicer.util.getNodesByClass('vtkMRMLScalarVolumeNode'))
+        self.fiducialNodeIds = dict.fromkeys(node.GetID() for node in slicer.util.getNodesByClass('vtkMRMLMarkupsFiducialNode'))
 
     def initializeParameterNode(self) -> None:
         """Ensure parameter node exists and observed."""
@@ -999,25 +1113,30 @@ class OpenLIFUDataWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
 
     def updateParametersFromSettings(self):
         parameterNode : vtkMRMLScriptedModuleNode = self._parameterNode.parameterNode
-        qsettings = qt.QSettings()
+        qsettings = self.qsettings
+        # The QSettings instance is shared, so the group must be ended even if something goes wrong in between
         qsettings.beginGroup("OpenLIFU")
-        for parameter_name in [
-            # List here the parameters that we want to make persistent in the application settings
-            "databaseDirectory",
-        ]:
-            if qsettings.contains(parameter_name):
-                parameterNode.SetParameter(
-                    parameter_name,
-                    qsettings.value(parameter_name)
-                )
-        qsettings.endGroup()
+        try:
+            for parameter_name in [
+                # List here the parameters that we want to make persistent in the application settings
+                "databaseDirectory",
+            ]:
+                if qsettings.contains(parameter_name):
+                    parameterNode.SetParameter(
+                        parameter_name,
+                        qsettings.value(parameter_name)
+                    )
+        finally:
+            qsettings.endGroup()
 
     def updateSettingFromParameter(self, parameter_name:str) -> None:
         parameterNode : vtkMRMLScriptedModuleNode = self._parameterNode.parameterNode
-        qsettings = qt.QSettings()
+        qsettings = self.qsettings
         qsettings.beginGroup("OpenLIFU")
-        qsettings.setValue(parameter_name,parameterNode.GetParameter(parameter_name))
-        qsettings.endGroup()
+        try:
+            qsettings.setValue(parameter_name,parameterNode.GetParameter(parameter_name))
+        finally:
+            qsettings.endGroup()
 
     def setParameterNode(self, inputParameterNode: Optional[OpenLIFUDataParameterNode]) -> None:
         """
@@ -1055,13 +1174,38 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
 
         self.db : Optional[openlifu.Database] = None
 
-        self._subjects : Dict[str, openlifu.db.subject.Subject] = {} # Mapping from subject id to Subject
+        self._subjects : Dict[str, openlifu.db.subject.Subject] = {} # Mapping from subject id to Subject, for subjects loaded so far
 
+        self._subject_names : Dict[str, str] = {} # Mapping from subject id to subject name, for all subjects in the database
+
+        self._session_infos : Dict[str, List[Tuple[str,str]]] = {} # Mapping from subject id to its (session_id, session_name) pairs, for subjects queried so far
+
+        self._parameterNodeWrapper : Optional[OpenLIFUDataParameterNode] = None # Cached wrapper of the parameter node
+
+        # Transducer transform nodes to which we have attached _on_transducer_transform_modified, keyed by node ID, so that
+        # a transducer that gets reused across session loads does not get observed more than once
+        self._observed_transducer_transform_nodes : Dict[str, vtkMRMLTransformNode] = {}
+
+        # Transducers that were unloaded because an affiliated node was removed from the scene, paired with their openlifu IDs,
+        # for which the user has yet to be notified. See on_transducer_affiliated_node_about_to_be_removed.
+        self._transducers_pending_unload_notification : List[Tuple[str, SlicerOpenLIFUTransducer]] = []
 
-    def getParameterNode(self):
-        return OpenLIFUDataParameterNode(super().getParameterNode())
 
-    def clear_session(self, clean_up_scene:bool = True) -> None:
+    def getParameterNode(self):
+        # Wrapping is not free, so we reuse the wrapper as long as it still wraps the current parameter node
+        # (the underlying node changes for example when the scene is closed).
+        parameter_node = super().getParameterNode()
+        if self._parameterNodeWrapper is None or self._parameterNodeWrapper.parameterNode is not parameter_node:
+            self._parameterNodeWrapper = OpenLIFUDataParameterNode(parameter_node)
+        return self._parameterNodeWrapper
+
+    def on_scene_start_close(self) -> None:
+        """Forget any references to scene content that the logic holds outside of the parameter node.
+        Call this when the scene is about to be closed."""
+        self._observed_transducer_transform_nodes.clear()
+        self._transducers_pending_unload_notification.clear()
+
+    def clear_session(self, clean_up_scene:bool = True, keep_transducer_id:Optional[str] = None) -> None:
         """Unload the current session if there is one loaded.
 
         Args:
@@ -1069,20 +1213,26 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
                 If False then the scene content is orphaned from its session, as though
                 it was manually loaded without the context of a session. If True then the scene
                 content is removed.
+            keep_transducer_id: The ID of a transducer to leave loaded even if it is the session's transducer
+                and clean_up_scene is True. This is used when re-loading a session, so that the session's
+                transducer can be reused rather than rebuilt if it has not changed.
         """
-        loaded_session = self.getParameterNode().loaded_session
+        parameter_node = self.getParameterNode()
+        loaded_session = parameter_node.loaded_session
         if loaded_session is None:
             return # There is no active session to clear
-        self.getParameterNode().loaded_session = None
+        parameter_node.loaded_session = None
         if clean_up_scene:
             loaded_session.clear_volume_and_target_nodes()
-            if loaded_session.get_transducer_id() in self.getParameterNode().loaded_transducers:
-                self.remove_transducer(loaded_session.get_transducer_id())
-            if loaded_session.get_protocol_id() in self.getParameterNode().loaded_protocols:
+            transducer_id = loaded_session.get_transducer_id()
+            if transducer_id in parameter_node.loaded_transducers and transducer_id != keep_transducer_id:
+                self.remove_transducer(transducer_id)
+            if loaded_session.get_protocol_id() in parameter_node.loaded_protocols:
                 self.remove_protocol(loaded_session.get_protocol_id())
+            loaded_solution = parameter_node.loaded_solution
             if (
-                self.getParameterNode().loaded_solution is not None
-                and loaded_session.last_generated_solution_id == self.getParameterNode().loaded_solution.solution.solution.id
+                loaded_solution is not None
+                and loaded_session.last_generated_solution_id == loaded_solution.solution.solution.id
             ):
                 self.clear_solution(clean_up_scene=True)
 
@@ -1105,7 +1255,8 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
         parameter_node.loaded_session = session # remember to write the updated session to the parameter node
 
         OnConflictOpts : "openlifu.db.database.OnConflictOpts" = openlifu_lz().db.database.OnConflictOpts
-        self.db.write_session(self._subjects[session_openlifu.subject_id],session_openlifu,on_conflict=OnConflictOpts.OVERWRITE)
+        self.db.write_session(self.get_subject(session_openlifu.subject_id),session_openlifu,on_conflict=OnConflictOpts.OVERWRITE)
+        self._session_infos.pop(session_openlifu.subject_id, None)
 
 
 
@@ -1172,8 +1323,8 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
     def load_database(self, path: Path) -> Sequence[Tuple[str,str]]:
         """Load an openlifu database from a local folder hierarchy.
 
-        This sets the internal openlifu database object and reads in all the subjects,
-        and returns the subject information.
+        This sets the internal openlifu database object and returns the subject information.
+        Subjects themselves are only loaded when they are needed; see `get_subject`.
 
         Args:
             path: Path to the openlifu database folder on disk.
@@ -1183,29 +1334,39 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
         """
         self.clear_session()
         self._subjects = {}
+        self._subject_names = {}
+        self._session_infos = {}
 
         self.db = openlifu_lz().Database(path)
         add_slicer_log_handler(self.db)
 
         subject_ids : List[str] = ensure_list(self.db.get_subject_ids())
-        self._subjects = {
-            subject_id : self.db.load_subject(subject_id)
-            for subject_id in subject_ids
+        subject_filenames = [self.db.get_subject_filename(subject_id) for subject_id in subject_ids]
+        subject_names = _map_file_reads(_read_name_from_json_file, subject_filenames)
+        self._subject_names = {
+            subject_id : subject_id if subject_name is None else subject_name # Subject falls back to its ID when there is no name
+            for subject_id, subject_name in zip(subject_ids, subject_names)
         }
 
-        subject_names = [subject.name for subject in self._subjects.values()]
+        return self._subject_names.items()
 
-        return zip(subject_ids, subject_names)
+    def get_subject_name(self, subject_id:str) -> str:
+        """Get the name of the subject with a given ID, without loading the full Subject if possible"""
+        subject_name = self._subject_names.get(subject_id, _MISSING)
+        if subject_name is _MISSING:
+            subject_name = self.get_subject(subject_id).name
+        return subject_name
 
     def get_subject(self, subject_id:str) -> "openlifu.db.subject.Subject":
         """Get the Subject with a given ID"""
         if self.db is None:
             raise RuntimeError("Unable to fetch subject info because there is no loaded database.")
-        try:
-            return self._subjects[subject_id] # use the in-memory Subject if it is in memory
-        except KeyError:
-            # otherwise attempt to load it:
-            return self.db.load_subject(subject_id)
+        subject = self._subjects.get(subject_id, _MISSING) # use the in-memory Subject if it is in memory
+        if subject is _MISSING:
+            # otherwise attempt to load it, and keep it in memory for next time:
+            subject = self.db.load_subject(subject_id)
+            self._subjects[subject_id] = subject
+        return subject
 
     def get_sessions(self, subject_id:str) -> "List[openlifu.db.session.Session]":
         """Get the collection of Sessions associated with a given subject ID"""
@@ -1230,8 +1391,19 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
         Returns: A sequence of pairs (session_id, session_name) running over all sessions
             for the given subject.
         """
-        sessions = self.get_sessions(subject_id)
-        return [(session.id, session.name) for session in sessions]
+        if self.db is None:
+            raise RuntimeError("Unable to fetch session info because there is no loaded database.")
+        session_info = self._session_infos.get(subject_id)
+        if session_info is None:
+            session_ids : List[str] = ensure_list(self.db.get_session_ids(subject_id))
+            session_filenames = [self.db.get_session_filename(subject_id, session_id) for session_id in session_ids]
+            session_names = _map_file_reads(_read_name_from_json_file, session_filenames)
+            session_info = [
+                (session_id, session_id if session_name is None else session_name) # Session falls back to its ID when there is no name
+                for session_id, session_name in zip(session_ids, session_names)
+            ]
+            self._session_infos[subject_id] = session_info
+        return session_info
 
     def get_session(self, subject_id:str, session_id:str) -> "openlifu.db.session.Session":
         """Fetch the Session with the given ID"""
@@ -1242,16 +1414,18 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
     def get_current_session_transducer_id(self) -> Optional[str]:
         """Get the transducer ID of the current session, if there is a current session. Returns None
         if there isn't a current session."""
-        if self.getParameterNode().loaded_session is None:
+        loaded_session = self.getParameterNode().loaded_session
+        if loaded_session is None:
             return None
-        return self.getParameterNode().loaded_session.get_transducer_id()
+        return loaded_session.get_transducer_id()
 
     def get_current_session_volume_id(self) -> Optional[str]:
         """Get the volume ID of the current session, if there is a current session. Returns None
         if there isn't a current session."""
-        if self.getParameterNode().loaded_session is None:
+        loaded_session = self.getParameterNode().loaded_session
+        if loaded_session is None:
             return None
-        return self.getParameterNode().loaded_session.get_volume_id()
+        return loaded_session.get_volume_id()
 
     def load_session(self, subject_id, session_id) -> None:
 
@@ -1263,9 +1437,10 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
         # === Ensure it's okay to load a session ===
 
         session_openlifu = self.get_session(subject_id, session_id)
-        loaded_session = self.getParameterNode().loaded_session
+        parameter_node = self.getParameterNode()
+        loaded_session = parameter_node.loaded_session
         if (
-            session_openlifu.transducer_id in self.getParameterNode().loaded_transducers
+            session_openlifu.transducer_id in parameter_node.loaded_transducers
             and (
                 loaded_session is None
                 or session_openlifu.transducer_id != loaded_session.get_transducer_id()
@@ -1279,7 +1454,7 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
                 return
 
         if (
-            session_openlifu.protocol_id in self.getParameterNode().loaded_protocols
+            session_openlifu.protocol_id in parameter_node.loaded_protocols
             and (
                 loaded_session is None
                 or session_openlifu.protocol_id != loaded_session.get_protocol_id()
@@ -1314,44 +1489,51 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
 
         # === Proceed with loading session ===
 
-        self.clear_session()
+        # The scene edits involved in loading a session are batched so that scene observers can react once at the end
+        slicer.mrmlScene.StartState(slicer.mrmlScene.BatchProcessState)
+        try:
+            # The session's transducer is kept around so that load_transducer_from_openlifu can reuse it if it is unchanged
+            self.clear_session(keep_transducer_id=session_openlifu.transducer_id)
 
-        volume_info = self.db.get_volume_info(session_openlifu.subject_id, session_openlifu.volume_id)
+            volume_info = self.db.get_volume_info(session_openlifu.subject_id, session_openlifu.volume_id)
 
-        # Create the SlicerOpenLIFU session object; this handles loading volume and targets
-        new_session = SlicerOpenLIFUSession.initialize_from_openlifu_session(
-            session_openlifu,
-            volume_info
-        )
+            # Create the SlicerOpenLIFU session object; this handles loading volume and targets
+            new_session = SlicerOpenLIFUSession.initialize_from_openlifu_session(
+                session_openlifu,
+                volume_info
+            )
 
-        # === Load transducer ===
+            # === Load transducer ===
 
-        newly_loaded_transducer = self.load_transducer_from_openlifu(
-            transducer = self.db.load_transducer(session_openlifu.transducer_id),
-            transducer_matrix = session_openlifu.array_transform.matrix,
-            transducer_matrix_units = session_openlifu.array_transform.units,
-            replace_confirmed = True,
-        )
-        newly_loaded_transducer.observe_transform_modified(self._on_transducer_transform_modified)
+            newly_loaded_transducer = self.load_transducer_from_openlifu(
+                transducer = self.db.load_transducer(session_openlifu.transducer_id),
+                transducer_matrix = session_openlifu.array_transform.matrix,
+                transducer_matrix_units = session_openlifu.array_transform.units,
+                replace_confirmed = True,
+            )
+            transform_node = newly_loaded_transducer.transform_node
+            if self._observed_transducer_transform_nodes.get(transform_node.GetID()) is not transform_node:
+                newly_loaded_transducer.observe_transform_modified(self._on_transducer_transform_modified)
+                self._observed_transducer_transform_nodes[transform_node.GetID()] = transform_node
 
-        # === Load protocol ===
+            # === Load protocol ===
 
-        self.load_protocol_from_openlifu(
-            self.db.load_protocol(session_openlifu.protocol_id),
-            replace_confirmed = True,
-        )
+            self.load_protocol_from_openlifu(
+                self.db.load_protocol(session_openlifu.protocol_id),
+                replace_confirmed = True,
+            )
+        finally:
+            slicer.mrmlScene.EndState(slicer.mrmlScene.BatchProcessState)
 
-        # === Toggle slice visibility and center slices on first target ===
+        # === Show the volume, toggle slice visibility and center slices on first target ===
 
+        slicer.util.setSliceViewerLayers(background=new_session.volume_node, fit=True)
         slices_center_point = new_session.get_initial_center_point()
+        slice_nodes = {slice_node.GetLayoutName() : slice_node for slice_node in slicer.util.getNodesByClass("vtkMRMLSliceNode")}
         for slice_node_name in ["Red", "Green", "Yellow"]:
-            sliceNode = slicer.util.getFirstNodeByClassByName("vtkMRMLSliceNode", slice_node_name)
+            sliceNode = slice_nodes[slice_node_name]
             sliceNode.JumpSliceByCentering(*slices_center_point)
             sliceNode.SetSliceVisible(True)
-        sliceNode = slicer.util.getFirstNodeByClassByName("vtkMRMLSliceNode", "Green")
-        sliceNode.SetSliceVisible(True)
-        sliceNode = slicer.util.getFirstNodeByClassByName("vtkMRMLSliceNode", "Yellow")
-        sliceNode.SetSliceVisible(True)
 
         # === Set the newly created session as the currently active session ===
 
@@ -1399,20 +1581,19 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
                 This could be used for example if we already know the user is okay with re-loading the protocol.
         """
         loaded_protocols = self.getParameterNode().loaded_protocols
-        if protocol.id in loaded_protocols and not replace_confirmed:
+        if not replace_confirmed and loaded_protocols.get(protocol.id) is not None:
             if not slicer.util.confirmYesNoDisplay(
                 f"A protocol with ID {protocol.id} is already loaded. Reload it?",
                 "Protocol already loaded",
             ):
                 return
-        self.getParameterNode().loaded_protocols[protocol.id] = SlicerOpenLIFUProtocol(protocol)
+        loaded_protocols[protocol.id] = SlicerOpenLIFUProtocol(protocol)
 
     def remove_protocol(self, protocol_id:str) -> None:
         """Remove a protocol from the list of loaded protocols."""
         loaded_protocols = self.getParameterNode().loaded_protocols
-        if not protocol_id in loaded_protocols:
+        if loaded_protocols.pop(protocol_id, _MISSING) is _MISSING:
             raise IndexError(f"No protocol with ID {protocol_id} appears to be loaded; cannot remove it.")
-        loaded_protocols.pop(protocol_id)
 
     def load_transducer_from_file(self, filepath:str) -> None:
         transducer = openlifu_lz().Transducer.from_file(filepath)
@@ -1445,13 +1626,20 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
                 "Transducer in use by session",
             )
             return
-        if transducer.id in self.getParameterNode().loaded_transducers:
+        parameter_node = self.getParameterNode()
+        existing_transducer : Optional[SlicerOpenLIFUTransducer] = parameter_node.loaded_transducers.get(transducer.id)
+        if existing_transducer is not None:
             if not replace_confirmed:
                 if not slicer.util.confirmYesNoDisplay(
                     f"A transducer with ID {transducer.id} is already loaded. Reload it?",
                     "Transducer already loaded",
                 ):
                     return
+            # If the very same transducer is already loaded then there is no need to rebuild its scene content;
+            # we only need to update its transform.
+            if existing_transducer.transducer.transducer.to_json(compact=True) == transducer.to_json(compact=True):
+                existing_transducer.set_transform_from_openlifu(transducer_matrix, transducer_matrix_units)
+                return existing_transducer
             self.remove_transducer(transducer.id)
 
         newly_loaded_transducer = SlicerOpenLIFUTransducer.initialize_from_openlifu_transducer(
@@ -1459,7 +1647,7 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
             transducer_matrix=transducer_matrix,
             transducer_matrix_units=transducer_matrix_units,
         )
-        self.getParameterNode().loaded_transducers[transducer.id] = newly_loaded_transducer
+        parameter_node.loaded_transducers[transducer.id] = newly_loaded_transducer
         return newly_loaded_transducer
 
     def remove_transducer(self, transducer_id:str, clean_up_scene:bool = True) -> None:
@@ -1470,11 +1658,12 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
             clean_up_scene: Whether to remove the SlicerOpenLIFUTransducer's affiliated nodes from the scene.
         """
         loaded_transducers = self.getParameterNode().loaded_transducers
-        if not transducer_id in loaded_transducers:
-            raise IndexError(f"No transducer with ID {transducer_id} appears to be loaded; cannot remove it.")
         # Clean-up order matters here: we should pop the transducer out of the loaded objects dict and *then* clear out its
         # affiliated nodes. This is because clearing the nodes triggers the check on_transducer_affiliated_node_removed.
-        transducer = loaded_transducers.pop(transducer_id)
+        transducer = loaded_transducers.pop(transducer_id, _MISSING)
+        if transducer is _MISSING:
+            raise IndexError(f"No transducer with ID {transducer_id} appears to be loaded; cannot remove it.")
+        self._observed_transducer_transform_nodes.pop(transducer.transform_node.GetID(), None)
         if clean_up_scene:
             transducer.clear_nodes()
 
@@ -1486,40 +1675,77 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
             affiliated_node_attribute_name: The name of the affected vtkMRMLNode-valued SlicerOpenLIFUTransducerNode attribute
                 (so "transform_node" or "model_node")
         """
-        matching_transducer_openlifu_ids = [
-            transducer_openlifu_id
-            for transducer_openlifu_id, transducer in self.getParameterNode().loaded_transducers.items()
-            if getattr(transducer,affiliated_node_attribute_name).GetID() == node_mrml_id
-        ]
-
-        # If this fails, then a single mrml node was shared across multiple loaded SlicerOpenLIFUTransducers, which
-        # should not be possible in the application logic.
-        assert(len(matching_transducer_openlifu_ids) <= 1)
+        if affiliated_node_attribute_name not in _TRANSDUCER_AFFILIATED_NODE_ATTRIBUTE_NAMES:
+            raise ValueError(f"{affiliated_node_attribute_name} is not a node attribute of SlicerOpenLIFUTransducer.")
 
-        if matching_transducer_openlifu_ids:
-            # Remove the transducer, but keep any other nodes under it. This transducer was removed
+        # Transducer nodes are tagged with the ID of the transducer they belong to, so we can look up the owning
+        # transducer directly rather than scanning all loaded transducers. The tag alone is not conclusive, since
+        # nodes orphaned from an unloaded transducer keep it, so we also check that the transducer still owns the node.
+        # Nodes from scenes saved before the tag was introduced do not have it, and for those we fall back to a scan.
+        loaded_transducers = self.getParameterNode().loaded_transducers
+        node = slicer.mrmlScene.GetNodeByID(node_mrml_id)
+        transducer_openlifu_id = node.GetAttribute('OpenLIFUData.transducer_id') if node is not None else None
+        if transducer_openlifu_id is None:
+            transducer_openlifu_id = next(
+                (
+                    loaded_transducer_openlifu_id
+                    for loaded_transducer_openlifu_id, loaded_transducer in loaded_transducers.items()
+                    if getattr(loaded_transducer,affiliated_node_attribute_name).GetID() == node_mrml_id
+                ),
+                None,
+            )
+        transducer = loaded_transducers.get(transducer_openlifu_id)
+        if transducer is not None and getattr(transducer,affiliated_node_attribute_name).GetID() == node_mrml_id:
+            # Remove the transducer, but keep any other nodes under it for now. This transducer was removed
             # by manual mrml scene manipulation, so we don't want to pull other nodes out from
-            # under the user.
-            transducer_openlifu_id = matching_transducer_openlifu_ids[0]
-            clean_up_scene = ObjectBeingUnloadedMessageBox(
-                message = f"The transducer with id {transducer_openlifu_id} will be unloaded because an affiliated node was removed from the scene.",
-                title="Transducer removed",
-                checkbox_tooltip = "Ensures cleanup of the model node and transform node affiliated with the transducer",
-            ).customexec_()
-            self.remove_transducer(transducer_openlifu_id, clean_up_scene=clean_up_scene)
-
-            # If the transducer that was just removed was in use by an active session, invalidate that session
-            self.validate_session()
+            # under the user. Whether to clean them up is asked in a single notification covering every transducer
+            # unloaded this way in the current batch of scene changes (e.g. the user deleting several nodes at once),
+            # rather than in one blocking dialog per transducer.
+            transducer_in_use_by_session = (transducer_openlifu_id == self.get_current_session_transducer_id())
+            self.remove_transducer(transducer_openlifu_id, clean_up_scene=False)
+            if not self._transducers_pending_unload_notification:
+                qt.QTimer.singleShot(0, self._notify_transducers_unloaded_by_node_removal)
+            self._transducers_pending_unload_notification.append((transducer_openlifu_id, transducer))
+
+            # If the transducer that was just removed was in use by an active session, invalidate that session.
+            # Only the session's dependency on this transducer could have changed, so there is nothing to validate otherwise.
+            if transducer_in_use_by_session:
+                self.validate_session()
+
+    def _notify_transducers_unloaded_by_node_removal(self) -> None:
+        """Notify the user about the transducers that were unloaded because an affiliated node was removed from the scene,
+        offering to clean up the rest of their affiliated nodes."""
+        pending = self._transducers_pending_unload_notification
+        self._transducers_pending_unload_notification = []
+        if not pending:
+            return
+        if len(pending) == 1:
+            message = f"The transducer with id {pending[0][0]} was unloaded because an affiliated node was removed from the scene."
+        else:
+            transducer_ids = ", ".join(transducer_openlifu_id for transducer_openlifu_id, _ in pending)
+            message = f"The transducers with ids {transducer_ids} were unloaded because affiliated nodes were removed from the scene."
+        clean_up_scene = ObjectBeingUnloadedMessageBox(
+            message = message,
+            title="Transducer removed",
+            checkbox_tooltip = "Ensures cleanup of the model node and transform node affiliated with the transducer",
+        ).customexec_()
+        if clean_up_scene:
+            # Skip transducers that were loaded again in the meantime, since their pending entries are then stale
+            loaded_transducers = self.getParameterNode().loaded_transducers
+            for transducer_openlifu_id, transducer in pending:
+                if transducer_openlifu_id not in loaded_transducers:
+                    transducer.clear_nodes()
 
     def set_solution(self, solution:SlicerOpenLIFUSolution):
         """Set a solution to be the currently active solution. If there is an active session, write that solution to the database."""
-        self.getParameterNode().loaded_solution = solution
+        parameter_node = self.getParameterNode()
+        parameter_node.loaded_solution = solution
         if self.validate_session():
             if self.db is None: # This should not happen -- if there is an active session then there should be a database connection as well.
                 raise RuntimeError("Unable to write solution to the session because there is no database connection")
-            session_openlifu = self.getParameterNode().loaded_session.session.session
+            session_openlifu = parameter_node.loaded_session.session.session
             solution_openlifu = solution.solution.solution
-            self.getParameterNode().loaded_session.last_generated_solution_id = solution_openlifu.id
+            parameter_node.loaded_session.last_generated_solution_id = solution_openlifu.id
             self.db.write_solution(session_openlifu, solution_openlifu)
 
 
@@ -1531,8 +1757,9 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
                 If False then the scene content is orphaned from its session.
                 If True then the scene content is removed.
         """
-        solution = self.getParameterNode().loaded_solution
-        self.getParameterNode().loaded_solution = None
+        parameter_node = self.getParameterNode()
+        solution = parameter_node.loaded_solution
+        parameter_node.loaded_solution = None
         if solution is None:
             return
         if clean_up_scene:
@@ -1578,6 +1805,8 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
                 return
 
         self.db.write_subject(newOpenLIFUSubject, on_conflict = openlifu_lz().db.database.OnConflictOpts.OVERWRITE)
+        self._subjects[newOpenLIFUSubject.id] = newOpenLIFUSubject
+        self._subject_names[newOpenLIFUSubject.id] = newOpenLIFUSubject.name
 
     def get_virtual_fit_approval_state(self) -> Optional[str]:
         """Get the virtual fit approval state in the current session, i.e. the value of virtual_fit_approval_for_target_id.
@@ -1617,8 +1846,8 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
 
         volume_filepath = Path(volume_dir,volume_metadata['data_filename'])
         loadedVolumeNode = slicer.util.loadVolume(volume_filepath)
-        # Note: OnNodeAdded/updateLoadedObjectsView is called before openLIFU metadata is assigned to the node so need
-        # call updateLoadedObjectsView again to display openlifu name/id.
+        # Note: OnNodeAdded is called before openLIFU metadata is assigned to the node. The loaded objects view refresh
+        # that it triggers is deferred, so the openlifu name/id assigned here will be picked up by it.
         assign_openlifu_metadata_to_volume_node(loadedVolumeNode, volume_metadata)
 
     def load_volume_from_file(self, filepath: str) -> None:
@@ -1628,23 +1857,9 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
         parent_dir = Path(filepath).parent
         volume_id = parent_dir.name # assuming the user selected a volume within the database
 
-        if slicer.app.coreIOManager().fileType(filepath) == 'VolumeFile':
-            # If a corresponding json file exists in the volume's parent directory,
-            # then use volume_metadata included in the json file
-            volume_json_filepath = Path(parent_dir, volume_id + '.json')
-            if volume_json_filepath.exists():
-                volume_metadata = json.loads(volume_json_filepath.read_text())
-                if volume_metadata['data_filename'] == Path(filepath).name:
-                    self.load_volume_from_openlifu(parent_dir, volume_metadata)
-                # If the selected file doesn't match the filename included in the json file, use default volume name and id based on filepath
-                else:
-                    slicer.util.loadVolume(filepath)
-            # Otherwise, use default volume name and id based on filepath
-            else:
-                slicer.util.loadVolume(filepath)
-
         # If the user selects a json file, infer volume filepath information based on the volume_metadata.
-        elif Path(filepath).suffix == '.json':
+        # This is checked first since it is a simple suffix test, sparing json files the volume file type check.
+        if Path(filepath).suffix == '.json':
             # Check for corresponding volume file
             volume_metadata = json.loads(Path(filepath).read_text())
             if 'data_filename' in volume_metadata:
@@ -1655,6 +1870,23 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
                     slicer.util.errorDisplay(f"Cannot find associated volume file: {volume_filepath}")
             else:
                 slicer.util.errorDisplay("Invalid volume filetype specified")
+
+        elif _is_volume_file(filepath):
+            # If a corresponding json file exists in the volume's parent directory,
+            # then use volume_metadata included in the json file
+            # (Attempting the read directly rather than checking for existence first saves a filesystem round trip)
+            volume_json_filepath = Path(parent_dir, volume_id + '.json')
+            try:
+                volume_metadata = json.loads(volume_json_filepath.read_text())
+            # Otherwise, use default volume name and id based on filepath
+            except FileNotFoundError:
+                slicer.util.loadVolume(filepath)
+            else:
+                if volume_metadata['data_filename'] == Path(filepath).name:
+                    self.load_volume_from_openlifu(parent_dir, volume_metadata)
+                # If the selected file doesn't match the filename included in the json file, use default volume name and id based on filepath
+                else:
+                    slicer.util.loadVolume(filepath)
         else:
             slicer.util.errorDisplay("Invalid volume filetype specified")
 
@@ -1707,6 +1939,7 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
             transducer_id = session_parameters['transducer_id']
         )
         self.db.write_session(self.get_subject(subject_id), newOpenLIFUSession, on_conflict = openlifu_lz().db.database.OnConflictOpts.OVERWRITE)
+        self._session_infos.pop(subject_id, None)
         return True
 
     def add_photoscan_to_database(self, subject_id: str, session_id: str, photoscan_parameters: Dict) -> None:
@@ -1743,8 +1976,9 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
         Raises runtime error if there is no active solution, or if there appears to be an active session to which the solution is
         affiliated but no connected database to enable writing.
         """
-        solution = self.getParameterNode().loaded_solution
-        session = self.getParameterNode().loaded_session
+        parameter_node = self.getParameterNode()
+        solution = parameter_node.loaded_solution
+        session = parameter_node.loaded_session
         if solution is None: # We should never be calling toggle_solution_approval if there's no active solution
             raise RuntimeError("Cannot toggle solution approval because there is no active solution.")
         solution.toggle_approval() # apply or revoke approval
@@ -1766,4 +2000,4 @@ class OpenLIFUDataLogic(ScriptedLoadableModuleLogic):
                     ),
                     windowTitle="Not saving approval state"
                 )
-        self.getParameterNode().loaded_solution = solution # remember to write the updated solution object into the parameter node
+        parameter_node.loaded_solution = solution # remember to write the updated solution object into the parameter node
@@ -13,6 +13,7 @@ from OpenLIFULib.targets import (
     fiducial_to_openlifu_point,
     fiducial_to_openlifu_point_in_transducer_coords,
     openlifu_point_to_fiducial,
+    openlifu_points_to_fiducials,
 )
 from OpenLIFULib.algorithm_input_widget import OpenLIFUAlgorithmInputWidget
 from OpenLIFULib.session import SlicerOpenLIFUSession, assign_openlifu_metadata_to_volume_node
@@ -42,5 +43,6 @@ __all__ = [
     "fiducial_to_openlifu_point",
     "fiducial_to_openlifu_point_in_transducer_coords",
     "openlifu_point_to_fiducial",
+    "openlifu_points_to_fiducials",
     "assign_openlifu_metadata_to_volume_node",
 ]
@@ -1,4 +1,5 @@
-from typing import Any, Sequence
+from typing import Any, Sequence, Tuple
+from functools import lru_cache
 import numpy as np
 from numpy.typing import NDArray
 import vtk
@@ -10,9 +11,9 @@ def numpy_to_vtk_4x4(numpy_array_4x4 : NDArray[Any]) -> vtk.vtkMatrix4x4:
             if numpy_array_4x4.shape != (4, 4):
                 raise ValueError("The input numpy array must be of shape (4, 4).")
             vtk_matrix = vtk.vtkMatrix4x4()
-            for i in range(4):
-                for j in range(4):
-                    vtk_matrix.SetElement(i, j, numpy_array_4x4[i, j])
+            # vtkMatrix4x4 stores its elements in row-major order, so the whole matrix can be set in one call
+            # rather than setting each of the 16 elements individually
+            vtk_matrix.DeepCopy(numpy_array_4x4.ravel().tolist())
             return vtk_matrix
 
 directions_in_RAS_coords_dict = {
@@ -24,11 +25,22 @@ directions_in_RAS_coords_dict = {
     'I' : np.array([0,0,-1]),
 }
 
-def get_xxx2ras_matrix(dims:Sequence[str]) -> NDArray[Any]:
-    return np.array([
+# The two helpers below are pure functions of a handful of possible inputs, so their results are cached.
+# The cached arrays are shared, so they are made read-only and callers are handed a copy.
+
+@lru_cache(maxsize=16)
+def _get_xxx2ras_matrix(dims:Tuple[str,...]) -> NDArray[Any]:
+    matrix = np.array([
         directions_in_RAS_coords_dict[dim] for dim in dims
     ]).transpose()
+    matrix.setflags(write=False)
+    return matrix
+
+def get_xxx2ras_matrix(dims:Sequence[str]) -> NDArray[Any]:
+    """Get the matrix that maps coordinates along the given direction names (e.g. 'LPS') to RAS coordinates."""
+    return _get_xxx2ras_matrix(tuple(dims)).copy()
 
+@lru_cache(maxsize=16)
 def get_xx2mm_scale_factor(length_unit:str) -> float:
     openlifu = openlifu_lz()
     return openlifu.util.units.getsiscale(length_unit, 'distance') / openlifu.util.units.getsiscale('mm', 'distance')
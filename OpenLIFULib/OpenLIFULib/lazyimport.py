@@ -51,13 +51,19 @@ def check_and_install_python_requirements(prompt_if_found = False) -> None:
                 windowTitle="Python dependencies still not found"
             )
 
+_openlifu_module = None # Cached handle to the openlifu module, set on the first successful openlifu_lz call
+
 def openlifu_lz() -> "openlifu":
     """Import openlifu and return the module, checking that it is installed along the way."""
+    global _openlifu_module
+    if _openlifu_module is not None:
+        return _openlifu_module
     if "openlifu" not in sys.modules:
         check_and_install_python_requirements(prompt_if_found=False)
         with BusyCursor():
             import openlifu
-    return sys.modules["openlifu"]
+    _openlifu_module = sys.modules["openlifu"]
+    return _openlifu_module
 
 def xarray_lz() -> "xarray":
     """Import xarray and return the module, checking that openlifu is installed along the way."""
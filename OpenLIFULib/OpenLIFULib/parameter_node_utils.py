@@ -32,6 +32,7 @@ if TYPE_CHECKING:
 class SlicerOpenLIFUProtocol:
     """Ultrathin wrapper of openlifu.Protocol. This exists so that protocols can have parameter node
     support while we still do lazy-loading of openlifu."""
+    __slots__ = ("protocol",)
     def __init__(self, protocol: "Optional[openlifu.Protocol]" = None):
         self.protocol = protocol
 
@@ -40,6 +41,7 @@ class SlicerOpenLIFUProtocol:
 class SlicerOpenLIFUTransducerWrapper:
     """Ultrathin wrapper of openlifu.Transducer. This exists so that transducers can have parameter node
     support while we still do lazy-loading of openlifu."""
+    __slots__ = ("transducer",)
     def __init__(self, transducer: "Optional[openlifu.Transducer]" = None):
         self.transducer = transducer
 
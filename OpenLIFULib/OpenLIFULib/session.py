@@ -12,15 +12,11 @@ from OpenLIFULib.util import get_openlifu_data_parameter_node
 from OpenLIFULib.lazyimport import openlifu_lz
 from OpenLIFULib.parameter_node_utils import SlicerOpenLIFUSessionWrapper
 from OpenLIFULib.targets import (
-    openlifu_point_to_fiducial,
+    openlifu_points_to_fiducials,
     fiducial_to_openlifu_point,
     fiducial_to_openlifu_point_id,
 )
-from OpenLIFULib.coordinate_system_utils import (
-    get_xx2mm_scale_factor,
-    get_xxx2ras_matrix,
-    linear_to_affine,
-)
+from OpenLIFULib.transducer import get_slicer2openlifu_transducer_matrix
 
 if TYPE_CHECKING:
     import openlifu
@@ -31,8 +27,9 @@ if TYPE_CHECKING:
 def assign_openlifu_metadata_to_volume_node(volume_node: vtkMRMLScalarVolumeNode, metadata: dict):
     """ Assign the volume name and ID used by OpenLIFU to a volume node"""
 
-    volume_node.SetName(metadata['name'])
-    volume_node.SetAttribute('OpenLIFUData.volume_id', metadata['id'])
+    with slicer.util.NodeModify(volume_node):
+        volume_node.SetName(metadata['name'])
+        volume_node.SetAttribute('OpenLIFUData.volume_id', metadata['id'])
 
 @parameterPack
 class SlicerOpenLIFUSession:
@@ -124,6 +121,7 @@ class SlicerOpenLIFUSession:
         volume_info : dict
     ) -> "SlicerOpenLIFUSession":
         """Create a SlicerOpenLIFUSession from an openlifu Session, loading affiliated data into the scene.
+        The volume is not shown in the slice views; that is left to the caller once everything is loaded.
 
         Args:
             session: OpenLIFU Session
@@ -132,11 +130,11 @@ class SlicerOpenLIFUSession:
         """
 
         # Load volume
-        volume_node = slicer.util.loadVolume(volume_info['data_abspath'])
+        volume_node = slicer.util.loadVolume(volume_info['data_abspath'], properties={'show': False})
         assign_openlifu_metadata_to_volume_node(volume_node, volume_info)
 
         # Load targets
-        target_nodes = [openlifu_point_to_fiducial(target) for target in session.targets]
+        target_nodes = openlifu_points_to_fiducials(session.targets)
 
         return SlicerOpenLIFUSession(SlicerOpenLIFUSessionWrapper(session), volume_node, target_nodes)
 
@@ -163,11 +161,8 @@ class SlicerOpenLIFUSession:
         transducer_openlifu = transducer.transducer.transducer
         transducer_transform_node : vtkMRMLTransformNode = transducer.transform_node
         transducer_transform_array = slicer.util.arrayFromTransformMatrix(transducer_transform_node, toWorld=True)
-        openlifu2slicer_matrix = linear_to_affine(
-            get_xxx2ras_matrix('LPS') * get_xx2mm_scale_factor(transducer_openlifu.units)
-        )
         self.session.session.array_transform = openlifu_lz().db.session.ArrayTransform(
-            matrix = np.linalg.inv(openlifu2slicer_matrix) @ transducer_transform_array,
+            matrix = get_slicer2openlifu_transducer_matrix(transducer_openlifu.units) @ transducer_transform_array,
             units = transducer_openlifu.units,
         )
 
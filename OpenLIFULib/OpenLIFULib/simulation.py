@@ -1,5 +1,4 @@
 from typing import TYPE_CHECKING
-from scipy.ndimage import affine_transform
 import numpy as np
 import vtk
 from vtk.util import numpy_support
@@ -47,6 +46,9 @@ def make_xarray_in_transducer_coords_from_volume(volume_node:vtkMRMLScalarVolume
     """Convert a volume node into a DataArray in the coordinates of a given transducer.
     See also `make_volume_from_xarray_in_transducer_coords`.
     """
+    # scipy is imported here rather than at module level since it is slow to import and only needed for this
+    from scipy.ndimage import affine_transform
+
     coords = protocol.sim_setup.get_coords()
     origin = np.array([coord_array[0].item() for coord_array in coords.values()])
     spacing = np.array([np.diff(coord_array)[0].item() for coord_array in coords.values()])
@@ -1,4 +1,5 @@
-from typing import List, TYPE_CHECKING, Optional
+from typing import List, TYPE_CHECKING, Optional, Tuple
+from functools import lru_cache
 import numpy as np
 import slicer
 from slicer import vtkMRMLMarkupsFiducialNode
@@ -24,10 +25,52 @@ def get_target_candidates() -> List[vtkMRMLMarkupsFiducialNode]:
         if fiducial_node.GetNumberOfControlPoints() == 1
     ]
 
+@lru_cache(maxsize=16)
+def _get_point2slicer_matrix(dims:Tuple[str,...], units:str) -> np.ndarray:
+    """Get the 3x3 matrix taking openlifu point coordinates with the given dims and units to Slicer (RAS, mm) coordinates.
+    The returned array is read-only, since it is shared between callers."""
+    matrix = get_xx2mm_scale_factor(units) * get_xxx2ras_matrix(dims)
+    matrix.setflags(write=False)
+    return matrix
+
+def openlifu_points_to_slicer_positions(points : "List[openlifu.Point]") -> np.ndarray:
+    """Convert the positions of openlifu Points to Slicer (RAS, mm) coordinates.
+
+    Points are grouped by their coordinate system and units so that each group is converted with one matrix product.
+
+    Returns: An array of shape (N,3) containing the converted positions, in the same order as the given points.
+    """
+    positions = np.ascontiguousarray([point.position for point in points], dtype=np.float64).reshape(-1,3)
+    point_indices_by_coordinate_system = {}
+    for i, point in enumerate(points):
+        point_indices_by_coordinate_system.setdefault((tuple(point.dims), point.units), []).append(i)
+    for (dims, units), indices in point_indices_by_coordinate_system.items():
+        positions[indices] = positions[indices] @ _get_point2slicer_matrix(dims, units).transpose()
+    return positions
+
+def openlifu_points_to_fiducials(points : "List[openlifu.Point]") -> List[vtkMRMLMarkupsFiducialNode]:
+    """Create fiducial nodes out of openlifu Points. See `openlifu_point_to_fiducial`.
+    This is preferable to calling `openlifu_point_to_fiducial` on each point, since the coordinate conversion is batched
+    and the scene is put in a batch processing state while the nodes are added.
+    """
+    positions = openlifu_points_to_slicer_positions(points)
+    if len(points) < 2: # Not worth the full refresh that ending a batch processing state triggers
+        return [_create_fiducial_for_openlifu_point(point, position) for point, position in zip(points, positions.tolist())]
+    slicer.mrmlScene.StartState(slicer.mrmlScene.BatchProcessState)
+    try:
+        # Converting the whole array to nested lists at once is cheaper than handing rows of the array to VTK one at a time
+        return [_create_fiducial_for_openlifu_point(point, position) for point, position in zip(points, positions.tolist())]
+    finally:
+        slicer.mrmlScene.EndState(slicer.mrmlScene.BatchProcessState)
+
 def openlifu_point_to_fiducial(point : "openlifu.Point") -> vtkMRMLMarkupsFiducialNode:
     """Create a fiducial node out of an openlifu Point, removing any existing nodes that would have the same name.
     The name of the node will be the openlifu point ID, so we do not allow this to be duplicated.
     """
+    return openlifu_points_to_fiducials([point])[0]
+
+def _create_fiducial_for_openlifu_point(point : "openlifu.Point", position : List[float]) -> vtkMRMLMarkupsFiducialNode:
+    """Create the fiducial node for an openlifu Point, given the point position already converted to Slicer coordinates."""
 
     # Clear out any existing nodes with this name
     node_name  = point.id
@@ -36,23 +79,21 @@ def openlifu_point_to_fiducial(point : "openlifu.Point") -> vtkMRMLMarkupsFiduci
         for  existing_node in existing_nodes_dict[node_name]:
             slicer.mrmlScene.RemoveNode(existing_node)
 
-    fiducial_node : vtkMRMLMarkupsFiducialNode = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLMarkupsFiducialNode")
-    fiducial_node.SetName(node_name)
-
-    # Get point position and convert it to Slicer coordinates
-    position = np.array(point.position)
-    position = get_xxx2ras_matrix(point.dims) @ position
-    position = get_xx2mm_scale_factor(point.units) * position
+    # Naming the node on creation spares the rename event that a separate SetName would fire
+    fiducial_node : vtkMRMLMarkupsFiducialNode = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLMarkupsFiducialNode", node_name)
 
     target_display_node = fiducial_node.GetDisplayNode()
     target_display_node.SetSelectedColor(point.color)
-    fiducial_node.SetLocked(True)
-    fiducial_node.SetMaximumNumberOfControlPoints(1)
 
-    fiducial_node.AddControlPoint(
-        position
-    )
-    fiducial_node.SetNthControlPointLabel(0,point.name)
+    # Batch the modifications so that observers of the node get notified once rather than for each step
+    with slicer.util.NodeModify(fiducial_node):
+        fiducial_node.SetLocked(True)
+        fiducial_node.SetMaximumNumberOfControlPoints(1)
+
+        fiducial_node.AddControlPoint(
+            position
+        )
+        fiducial_node.SetNthControlPointLabel(0,point.name)
 
     return fiducial_node
 
@@ -1,4 +1,5 @@
 from typing import Optional, TYPE_CHECKING, Callable, Any
+from functools import lru_cache
 import numpy as np
 import slicer
 from slicer import (
@@ -17,6 +18,42 @@ from OpenLIFULib.coordinate_system_utils import (
 if TYPE_CHECKING:
     import openlifu # This import is deferred at runtime, but it is done here for IDE and static analysis purposes
 
+# TODO: Instead of harcoding 'LPS' in the two functions below, use something like a "dims" attribute that should be
+# associated with the openlifu transducer object. There is no such attribute yet but it should exist eventually once this is done:
+# https://github.com/OpenwaterHealth/opw_neuromod_sw/issues/3
+
+@lru_cache(maxsize=8)
+def get_openlifu2slicer_transducer_matrix(units:str) -> np.ndarray:
+    """Get the 4x4 affine matrix taking openlifu transducer space, in the given units, to Slicer (RAS, mm) space.
+    The returned array is read-only, since it is shared between callers."""
+    matrix = linear_to_affine(get_xxx2ras_matrix('LPS') * get_xx2mm_scale_factor(units))
+    matrix.setflags(write=False)
+    return matrix
+
+@lru_cache(maxsize=8)
+def get_slicer2openlifu_transducer_matrix(units:str) -> np.ndarray:
+    """Get the inverse of `get_openlifu2slicer_transducer_matrix`.
+    That matrix is a scaled signed permutation (an axis flip combined with a unit scaling), so rather than numerically
+    inverting it we invert it directly: transpose the orthogonal part and divide by the scale.
+    The returned array is read-only, since it is shared between callers."""
+    matrix = linear_to_affine(get_xxx2ras_matrix('LPS').transpose() / get_xx2mm_scale_factor(units))
+    matrix.setflags(write=False)
+    return matrix
+
+def _get_transducer_transform_in_slicer_coordinates(
+        transducer : "openlifu.Transducer",
+        transducer_matrix: Optional[np.ndarray]=None,
+        transducer_matrix_units: Optional[str]=None,
+    ) -> np.ndarray:
+    """Convert an openlifu transducer transform matrix into the matrix to use for the transducer's transform node in Slicer.
+    See `SlicerOpenLIFUTransducer.initialize_from_openlifu_transducer` for the meaning of the arguments."""
+    if transducer_matrix is None:
+        transducer_matrix = np.eye(4)
+    if transducer_matrix_units is None:
+        transducer_matrix_units = transducer.units
+    transform_in_native_transducer_coordinates = transducer.convert_transform(transducer_matrix, transducer_matrix_units)
+    return get_openlifu2slicer_transducer_matrix(transducer.units) @ transform_in_native_transducer_coordinates
+
 @parameterPack
 class SlicerOpenLIFUTransducer:
     """An openlifu Trasducer that has been loaded into Slicer (has a model node and transform node)"""
@@ -42,38 +79,50 @@ class SlicerOpenLIFUTransducer:
         Returns: the newly constructed SlicerOpenLIFUTransducer object
         """
 
-        model_node = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLModelNode")
-        model_node.SetName(slicer.mrmlScene.GenerateUniqueName(transducer.id))
-        model_node.SetAndObservePolyData(transducer.get_polydata())
-        transform_node = slicer.mrmlScene.AddNewNodeByClass("vtkMRMLTransformNode")
-        transform_node.SetName(slicer.mrmlScene.GenerateUniqueName(f"{transducer.id}-matrix"))
-        model_node.SetAndObserveTransformNodeID(transform_node.GetID())
+        transform_matrix_numpy = _get_transducer_transform_in_slicer_coordinates(
+            transducer, transducer_matrix, transducer_matrix_units
+        )
 
-        # TODO: Instead of harcoding 'LPS' here, use something like a "dims" attribute that should be associated with
-        # the `transducer` object. There is no such attribute yet but it should exist eventually once this is done:
-        # https://github.com/OpenwaterHealth/opw_neuromod_sw/issues/3
-        openlifu2slicer_matrix = linear_to_affine(
-            get_xxx2ras_matrix('LPS') * get_xx2mm_scale_factor(transducer.units)
+        # The transform is fully set up before the model starts observing it, and nodes are named as they are
+        # added, so that observers of the new nodes do not get notified of a series of intermediate states.
+        transform_node = slicer.mrmlScene.AddNewNodeByClass(
+            "vtkMRMLTransformNode",
+            slicer.mrmlScene.GenerateUniqueName(f"{transducer.id}-matrix"),
         )
-        if transducer_matrix is None:
-            transducer_matrix = np.eye(4)
-        if transducer_matrix_units is None:
-            transducer_matrix_units = transducer.units
-        transform_in_native_transducer_coordinates = transducer.convert_transform(transducer_matrix, transducer_matrix_units)
-        transform_matrix_numpy = openlifu2slicer_matrix @ transform_in_native_transducer_coordinates
-
-        transform_matrix_vtk = numpy_to_vtk_4x4(transform_matrix_numpy)
-        transform_node.SetMatrixTransformToParent(transform_matrix_vtk)
+        transform_node.SetMatrixTransformToParent(numpy_to_vtk_4x4(transform_matrix_numpy))
+        transform_node.SetAttribute('OpenLIFUData.transducer_id', transducer.id)
+
+        model_node = slicer.mrmlScene.AddNewNodeByClass(
+            "vtkMRMLModelNode",
+            slicer.mrmlScene.GenerateUniqueName(transducer.id),
+        )
+        model_node.SetAttribute('OpenLIFUData.transducer_id', transducer.id)
+        model_node.SetAndObservePolyData(transducer.get_polydata())
+        model_node.SetAndObserveTransformNodeID(transform_node.GetID())
         model_node.CreateDefaultDisplayNodes() # toggles the "eyeball" on
 
         return SlicerOpenLIFUTransducer(
             SlicerOpenLIFUTransducerWrapper(transducer), model_node, transform_node
         )
 
+    def set_transform_from_openlifu(
+            self,
+            transducer_matrix: Optional[np.ndarray]=None,
+            transducer_matrix_units: Optional[str]=None,
+        ) -> None:
+        """Set the transducer transform node from an openlifu transform matrix.
+        The arguments are interpreted as in `initialize_from_openlifu_transducer`."""
+        transform_matrix_numpy = _get_transducer_transform_in_slicer_coordinates(
+            self.transducer.transducer, transducer_matrix, transducer_matrix_units
+        )
+        self.transform_node.SetMatrixTransformToParent(numpy_to_vtk_4x4(transform_matrix_numpy))
+
     def clear_nodes(self) -> None:
-        """Clear associated mrml nodes from the scene. Do this when removing a transducer."""
-        slicer.mrmlScene.RemoveNode(self.model_node)
-        slicer.mrmlScene.RemoveNode(self.transform_node)
+        """Clear associated mrml nodes from the scene. Do this when removing a transducer.
+        Nodes that are no longer in the scene (e.g. because the user already deleted them) are skipped."""
+        for node in (self.model_node, self.transform_node):
+            if node is not None and slicer.mrmlScene.IsNodePresent(node):
+                slicer.mrmlScene.RemoveNode(node)
 
     def observe_transform_modified(self, callback : "Callable[[SlicerOpenLIFUTransducer],Any]") -> int:
         """Add an observer to the TransformModifiedEvent of the transducer's transform node, providing this object to the callback.
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, List, TypeVar, Type
+from typing import TYPE_CHECKING, Any, List, Optional, TypeVar, Type
 import logging
 import qt
 import slicer
@@ -78,10 +78,18 @@ def ensure_list(item: Any) -> List[Any]:
     else:
         return [item]
 
+_noneditable_QStandardItem_prototype : "Optional[qt.QStandardItem]" = None
+
 def create_noneditable_QStandardItem(text:str) -> qt.QStandardItem:
-            item = qt.QStandardItem(text)
-            item.setEditable(False)
-            return item
+    """Create a QStandardItem with the given text that is not editable. Items are cloned from a
+    prototype item so that the flags only need to be set up once."""
+    global _noneditable_QStandardItem_prototype
+    if _noneditable_QStandardItem_prototype is None:
+        _noneditable_QStandardItem_prototype = qt.QStandardItem()
+        _noneditable_QStandardItem_prototype.setEditable(False)
+    item = _noneditable_QStandardItem_prototype.clone()
+    item.setText(text)
+    return item
 
 def replace_widget(old_widget: qt.QWidget, new_widget: qt.QWidget, ui_object=None):
     """Replace a widget by another. Meant for use in a scripted module, to replace widgets inside a layout.
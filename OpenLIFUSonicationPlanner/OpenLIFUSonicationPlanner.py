@@ -434,19 +434,13 @@ class OpenLIFUSonicationPlannerWidget(ScriptedLoadableModuleWidget, VTKObservati
                     str(values[i]) if i<len(values) else ""
                     for i in range(max_len)
                 ]
-                self.focusAnalysisTableModel.appendRow(list(map(
-                    create_noneditable_QStandardItem,
-                    [field.name, *value_strs]
-                )))
+                self.focusAnalysisTableModel.appendRow([create_noneditable_QStandardItem(text) for text in [field.name, *value_strs]])
 
             # individual floats go into the globalAnalysisTableModel
             elif origin is Union and len(args)==2 and float in args and type(None) in args:
                 value = getattr(analysis_openlifu,field.name)
                 value_str = str(value) if value is not None else ""
-                self.globalAnalysisTableModel.appendRow(list(map(
-                    create_noneditable_QStandardItem,
-                    [field.name, value_str]
-                )))
+                self.globalAnalysisTableModel.appendRow([create_noneditable_QStandardItem(text) for text in [field.name, value_str]])
 
             else:
                 raise RuntimeError(f"Not sure what to do with the SolutionAnalysis field {field.name}")